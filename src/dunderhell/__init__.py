@@ -2,37 +2,217 @@ from __future__ import annotations
 
 import ast
 import builtins
-import math
-from textwrap import dedent
-from typing import Callable, Sequence, Type, TypeVar
+import operator
+import sys
+from typing import Any, Callable, Iterable, Sequence, Type, TypeVar
+
+# Operator nodes carry no data, so a single instance is shared by every BinOp we build.
+_ADD_OP = ast.Add()
+_MULT_OP = ast.Mult()
+_FLOORDIV_OP = ast.FloorDiv()
+_SUB_OP = ast.Sub()
+
+# AST nodes are never subclassed, so the visitors compare exact types with `type()`,
+# which is cheaper than `isinstance()` in these hot loops.
+_IS_OPS = {ast.Is, ast.IsNot}
+
+# Only free-threaded builds of Python can run pure Python code in parallel.
+_GIL_DISABLED = not getattr(sys, "_is_gil_enabled", lambda: True)()
 
 
 def dunderify(tree: ast.AST) -> None:
     """Turn Python code into dunders."""
     visitors = [
+        ConstantFolder(),
         BuiltinsRenamer(),
-        StringVisitor(),
-        NumberVisitor(),
-        OpVisitor(),
+        # Renaming runs before the numbers and strings are expanded, so it only has
+        # to walk the much smaller original tree.
         LocalVariableRenamer(),
+        DunderifyVisitor(),
     ]
 
     for visitor in visitors:
         visitor.visit(tree)
 
-    ast.fix_missing_locations(tree)
+    fix_missing_locations(tree)
+
+
+def dunderify_source(source: str) -> str:
+    """Turn Python source code into dunders, and return the dunderified source."""
+    tree = ast.parse(source)
+    dunderify(tree)
+    return ast.unparse(tree)
+
+
+def fix_missing_locations(tree: ast.AST) -> None:
+    """
+    Same as `ast.fix_missing_locations`, but walks the tree with a stack instead of
+    recursion, and visits nodes that are shared across the tree only once.
+
+    The dunderified tree reuses the same number and character nodes all over, so
+    `ast.fix_missing_locations` would walk each of those subtrees again every time
+    they appear. Skipping them is safe, as once a node has been visited, it and all
+    of its children already have their locations set.
+    """
+    visited: set[int] = set()
+    # Nodes are typed as Any, as the location attributes aren't declared on ast.AST
+    stack: list[tuple[Any, int, int, int, int]] = [(tree, 1, 0, 1, 0)]
+    while stack:
+        node, lineno, col_offset, end_lineno, end_col_offset = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+
+        attributes = node._attributes
+        if "lineno" in attributes:
+            if not hasattr(node, "lineno"):
+                node.lineno = lineno
+            else:
+                lineno = node.lineno
+        if "end_lineno" in attributes:
+            if getattr(node, "end_lineno", None) is None:
+                node.end_lineno = end_lineno
+            else:
+                end_lineno = node.end_lineno
+        if "col_offset" in attributes:
+            if not hasattr(node, "col_offset"):
+                node.col_offset = col_offset
+            else:
+                col_offset = node.col_offset
+        if "end_col_offset" in attributes:
+            if getattr(node, "end_col_offset", None) is None:
+                node.end_col_offset = end_col_offset
+            else:
+                end_col_offset = node.end_col_offset
+
+        # Children are pushed in reverse, so that they're visited in the same order
+        # as `ast.fix_missing_locations` visits them.
+        children = list(ast.iter_child_nodes(node))
+        for child in reversed(children):
+            stack.append((child, lineno, col_offset, end_lineno, end_col_offset))
 
 
 def make_binop(op: ast.operator, exprs: Sequence[ast.expr]) -> ast.expr:
     """
     Builds a BinOp tree joining the `exprs` with the given `op`.
     For eg. if `op` is `ast.Add()`, returns AST node for `expr1 + expr2 + ...`.
+
+    The tree is balanced, i.e. `(expr1 + expr2) + (expr3 + expr4)`, so its depth
+    grows logarithmically with the number of `exprs`. Only use this with
+    associative operators.
+    """
+    if len(exprs) == 1:
+        return exprs[0]
+
+    middle = len(exprs) // 2
+    return ast.BinOp(
+        make_binop(op, exprs[:middle]),
+        op,
+        make_binop(op, exprs[middle:]),
+    )
+
+
+def _dunder_name_attribute(*attrs: str) -> ast.expr:
+    """Builds the AST node for `__name__.<attr1>.<attr2>...`."""
+    node: ast.expr = ast.Name(id="__name__", ctx=ast.Load())
+    for attr in attrs:
+        node = ast.Attribute(node, attr=attr, ctx=ast.Load())
+
+    return node
+
+
+def _build_chr_definition() -> ast.Assign:
     """
-    expr_tree, *exprs = exprs
-    for expr in exprs:
-        expr_tree = ast.BinOp(expr_tree, op, expr)
+    Builds the AST for the following code by hand:
+
+        __chr__ = __builtins__.__getattribute__(
+            __name__.__reduce__.__name__[6]
+            + __name__.__add__.__class__.__name__[3]
+            + __name__.__class__.__name__[-1]
+        )
 
-    return expr_tree
+    Fresh nodes are built on every call, so each output tree gets its own.
+    """
+    return ast.Assign(
+        targets=[ast.Name(id="__chr__", ctx=ast.Store())],
+        value=ast.Call(
+            func=ast.Attribute(
+                ast.Name(id="__builtins__", ctx=ast.Load()),
+                attr="__getattribute__",
+                ctx=ast.Load(),
+            ),
+            args=[
+                ast.BinOp(
+                    ast.BinOp(
+                        ast.Subscript(
+                            _dunder_name_attribute("__reduce__", "__name__"),
+                            slice=ast.Constant(6),
+                            ctx=ast.Load(),
+                        ),
+                        _ADD_OP,
+                        ast.Subscript(
+                            _dunder_name_attribute("__add__", "__class__", "__name__"),
+                            slice=ast.Constant(3),
+                            ctx=ast.Load(),
+                        ),
+                    ),
+                    _ADD_OP,
+                    ast.Subscript(
+                        _dunder_name_attribute("__class__", "__name__"),
+                        slice=ast.UnaryOp(ast.USub(), ast.Constant(1)),
+                        ctx=ast.Load(),
+                    ),
+                )
+            ],
+            keywords=[],
+        ),
+    )
+
+
+class ConstantFolder(ast.NodeTransformer):
+    """
+    Evaluates integer arithmetic between literals beforehand, so that there are fewer
+    numbers to convert into dunders.
+
+    Only folds results that are non negative, and never folds a division by zero.
+
+    Input:
+        print(2 + 2, 10 // 3 * x)
+
+    Output:
+        print(4, 3 * x)
+    """
+
+    fold_map: dict[Type[ast.operator], Callable[[int, int], int]] = {
+        ast.Add: operator.add,
+        ast.FloorDiv: operator.floordiv,
+        ast.Mult: operator.mul,
+        ast.Sub: operator.sub,
+    }
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.expr:
+        super().generic_visit(node)
+
+        fold = self.fold_map.get(type(node.op))
+        if fold is None:
+            return node
+
+        left, right = node.left, node.right
+        if type(left) is not ast.Constant or type(right) is not ast.Constant:
+            return node
+
+        if type(left.value) is not int or type(right.value) is not int:
+            return node
+
+        if type(node.op) is ast.FloorDiv and right.value == 0:
+            # Leave the ZeroDivisionError to be raised at runtime
+            return node
+
+        value = fold(left.value, right.value)
+        if value < 0:
+            return node
+
+        return ast.Constant(value)
 
 
 class StringVisitor(ast.NodeTransformer):
@@ -55,29 +235,28 @@ class StringVisitor(ast.NodeTransformer):
     """
 
     def __init__(self) -> None:
-        chr_tree = ast.parse(
-            dedent(
-                """
-                __chr__ = __builtins__.__getattribute__(
-                    __name__.__reduce__.__name__[6]
-                    + __name__.__add__.__class__.__name__[3]
-                    + __name__.__class__.__name__[-1]
-                )
-                """
-            )
-        )
-        self.chr_definition = chr_tree.body[0]
+        super().__init__()
+        # Load context names can be shared, so every call in the tree reuses these
+        self.chr_name = ast.Name("__chr__", ctx=ast.Load())
+        self.dunder_name = ast.Name(id="__name__", ctx=ast.Load())
+        # `__chr__()` calls that have already been built, by character number
+        self._chr_cache: dict[int, ast.Call] = {}
+        self.chr_definition = _build_chr_definition()
         self.string_found = False
 
-    @staticmethod
-    def create_chr(character: str) -> ast.Call:
+    def create_chr(self, character: str) -> ast.Call:
         """Creates a `__chr__()` call from a character eg. 'a' -> __chr__(97)."""
         char_number = ord(character)
-        return ast.Call(
-            func=ast.Name("__chr__", ctx=ast.Load()),
-            args=[ast.Constant(char_number)],
-            keywords=[],
-        )
+        chr_call = self._chr_cache.get(char_number)
+        if chr_call is None:
+            chr_call = ast.Call(
+                func=self.chr_name,
+                args=[ast.Constant(char_number)],
+                keywords=[],
+            )
+            self._chr_cache[char_number] = chr_call
+
+        return chr_call
 
     def visit_Constant(self, node: ast.Constant) -> ast.expr:
         super().generic_visit(node)
@@ -92,7 +271,7 @@ class StringVisitor(ast.NodeTransformer):
             # Create empty string by doing `__name__.__class__()`
             return ast.Call(
                 func=ast.Attribute(
-                    ast.Name(id="__name__", ctx=ast.Load()),
+                    self.dunder_name,
                     attr="__class__",
                     ctx=ast.Load(),
                 ),
@@ -102,11 +281,11 @@ class StringVisitor(ast.NodeTransformer):
 
         # If single character, can return just the one __chr__(N) call
         if len(string) == 1:
-            self.create_chr(string)
+            return self.create_chr(string)
 
         # Otherwise we need to create a BinOp tree
         chr_nodes = [self.create_chr(character) for character in string]
-        return make_binop(ast.Add(), chr_nodes)
+        return make_binop(_ADD_OP, chr_nodes)
 
     def visit_Module(self, node: ast.Module) -> ast.Module:
         super().generic_visit(node)
@@ -135,49 +314,74 @@ class NumberVisitor(ast.NodeTransformer):
         )
     """
 
-    # __name__.__len__() == 8
-    eight = ast.Call(
-        func=ast.Attribute(
-            ast.Name(id="__name__", ctx=ast.Load()),
-            attr="__len__",
-            ctx=ast.Load(),
-        ),
-        args=[],
-        keywords=[],
-    )
-    # eight // eight == 1
-    one = ast.BinOp(eight, ast.FloorDiv(), eight)
-    # eight - eight == 0
-    zero = ast.BinOp(eight, ast.Sub(), eight)
-
-    @classmethod
-    def build_number_under_8(cls, number: int) -> ast.expr:
+    def __init__(self) -> None:
+        super().__init__()
+        # __name__.__len__() == 8
+        self.eight = ast.Call(
+            func=ast.Attribute(
+                ast.Name(id="__name__", ctx=ast.Load()),
+                attr="__len__",
+                ctx=ast.Load(),
+            ),
+            args=[],
+            keywords=[],
+        )
+        # eight // eight == 1
+        self.one = self.join_numbers(_FLOORDIV_OP, [self.eight, self.eight])
+        # eight - eight == 0
+        self.zero = self.join_numbers(_SUB_OP, [self.eight, self.eight])
+
+        # Number trees that have already been built, shared between all constants in
+        # the tree with the same value. Sharing nodes is fine, as `ast.unparse` just
+        # walks them, but anything that rewrites a number tree must rewrite a copy.
+        self._cache: dict[int, ast.expr] = {}
+        self._powers_of_8: dict[int, ast.expr] = {}
+
+    def join_numbers(self, op: ast.operator, exprs: Sequence[ast.expr]) -> ast.expr:
+        """Joins the parts of a number with the given `op`, see `make_binop`."""
+        return make_binop(op, exprs)
+
+    def build_number_under_8(self, number: int) -> ast.expr:
         if number == 0:
-            return cls.zero
+            return self.zero
+
+        return self.join_numbers(_ADD_OP, [self.one] * number)
+
+    def build_number(self, number: int) -> ast.expr:
+        number_tree = self._cache.get(number)
+        if number_tree is None:
+            number_tree = self._cache[number] = self._build_number(number)
+
+        return number_tree
 
-        return make_binop(ast.Add(), [cls.one] * number)
+    def build_power_of_8(self, power: int) -> ast.expr:
+        """Creates `8**power` by doing 8*8*8*..., `power` times."""
+        power_tree = self._powers_of_8.get(power)
+        if power_tree is None:
+            power_tree = self.join_numbers(_MULT_OP, [self.eight] * power)
+            self._powers_of_8[power] = power_tree
 
-    @classmethod
-    def build_number(cls, number: int) -> ast.expr:
+        return power_tree
+
+    def _build_number(self, number: int) -> ast.expr:
         if number < 8:
-            return cls.build_number_under_8(number)
+            return self.build_number_under_8(number)
+
+        # Split the number into its base 8 digits, most significant first.
+        # `oct()` does this in C, which matters for very large numbers.
+        digits = [int(digit) for digit in oct(number)[2:]]
 
+        # Every digit `d` at position `k` contributes `d` copies of `8**k`
         number_parts: list[ast.expr] = []
-        remainder = number
-        while remainder >= 8:
-            log_8 = int(math.log(remainder, 8))
-            # Create a power of 8 by doing 8*8*8*..., `log_8` times
-            eight_tree = make_binop(ast.Mult(), [cls.eight] * log_8)
-            number_parts.append(eight_tree)
-            # we just created this power of 8, subtract to get remainder
-            remainder -= 8**log_8
-
-        # now remainder is under 8.
-        if remainder > 0:
-            number_parts.append(cls.build_number_under_8(remainder))
+        for power, digit in zip(range(len(digits) - 1, 0, -1), digits):
+            number_parts.extend([self.build_power_of_8(power)] * digit)
+
+        # The last digit is under 8, go through the cache so its tree is shared.
+        if digits[-1] > 0:
+            number_parts.append(self.build_number(digits[-1]))
 
         # Now we need to add all the parts together
-        return make_binop(ast.Add(), number_parts)
+        return self.join_numbers(_ADD_OP, number_parts)
 
     def visit_Constant(self, node: ast.Constant) -> ast.expr:
         super().generic_visit(node)
@@ -259,7 +463,7 @@ class OpVisitor(ast.NodeTransformer):
 
     def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.expr:
         super().generic_visit(node)
-        if isinstance(node.op, ast.Not):
+        if type(node.op) is ast.Not:
             # These can't be turned into a dunder directly.
             return node
 
@@ -275,19 +479,15 @@ class OpVisitor(ast.NodeTransformer):
     def visit_Compare(self, node: ast.Compare) -> ast.expr:
         super().generic_visit(node)
 
-        if any(isinstance(op, (ast.Is, ast.IsNot)) for op in node.ops):
+        if any(type(op) in _IS_OPS for op in node.ops):
             # These can't be turned into a dunder directly.
             # If you're using `IsVisitor` before `OpVisitor`, this should never be hit.
             return node
 
         parts: list[ast.expr] = []
         # Create `(a<b), (b<c), (c<d), ...` etc. in `parts`
-        for op, (idx, right) in zip(node.ops, enumerate(node.comparators), strict=True):
-            if idx == 0:
-                left = node.left
-            else:
-                left = node.comparators[idx - 1]
-
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
             op_type = type(op)
             dunder_name = self.cmp_op_map[op_type]
             if op_type in (ast.In, ast.NotIn):
@@ -300,11 +500,82 @@ class OpVisitor(ast.NodeTransformer):
                 comparison = self.call_method(left, dunder_name, args=[right])
 
             parts.append(comparison)
+            left = right
 
         # Return `(a<b) and (b<c) and (c<d) and ...`
         return ast.BoolOp(ast.And(), parts)
 
 
+class DunderifyVisitor(StringVisitor, NumberVisitor, OpVisitor):
+    """
+    Runs `StringVisitor`, `NumberVisitor` and `OpVisitor` in a single pass.
+
+    Numbers are built with their operators already converted to method calls, so
+    they don't need another traversal of the whole tree. Strings are built out of
+    `__chr__()` calls that are already converted.
+
+    Converted nodes are only shared within the tree being visited, so the trees from
+    separate `dunderify` calls never share nodes that a caller could modify.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Fully converted `__chr__()` calls, shared between all strings.
+        self._dunderified_chrs: dict[str, ast.Call] = {}
+
+    def join_numbers(self, op: ast.operator, exprs: Sequence[ast.expr]) -> ast.expr:
+        """Same as `make_binop`, but calls the dunder method of `op` instead."""
+        if len(exprs) == 1:
+            return exprs[0]
+
+        middle = len(exprs) // 2
+        return self.call_method(
+            self.join_numbers(op, exprs[:middle]),
+            self.bin_op_map[type(op)],
+            args=[self.join_numbers(op, exprs[middle:])],
+        )
+
+    def create_chr(self, character: str) -> ast.Call:
+        """Creates a `__chr__()` call with the character number already converted."""
+        chr_call = self._dunderified_chrs.get(character)
+        if chr_call is None:
+            chr_call = ast.Call(
+                func=self.chr_name,
+                args=[self.build_number(ord(character))],
+                keywords=[],
+            )
+            self._dunderified_chrs[character] = chr_call
+
+        return chr_call
+
+    def join_string(self, node: ast.expr) -> ast.expr:
+        """Converts the `+` joining the `__chr__()` calls of a string to `__add__`."""
+        if type(node) is ast.BinOp:
+            left = self.join_string(node.left)
+            right = self.join_string(node.right)
+            return self.call_method(left, "__add__", args=[right])
+
+        return node
+
+    def visit_Constant(self, node: ast.Constant) -> ast.expr:
+        if type(node.value) is str:
+            return self.join_string(StringVisitor.visit_Constant(self, node))
+
+        if type(node.value) is int:
+            return self.build_number(node.value)
+
+        return node
+
+    def visit_Module(self, node: ast.Module) -> ast.Module:
+        self.generic_visit(node)
+
+        if self.string_found:
+            chr_definition = self.visit(self.chr_definition)
+            node.body.insert(0, chr_definition)
+
+        return node
+
+
 class VariableRenamer(ast.NodeTransformer):
     """Renames all `Name` nodes with given names, to dunders."""
 
@@ -326,12 +597,17 @@ class VariableRenamer(ast.NodeTransformer):
     def visit_arg(self, node: ast.arg) -> ast.arg:
         if node.arg in self.names:
             # Replace name with dundered name
-            node.arg = f"__{node.arg}__"
+            node.arg = sys.intern(f"__{node.arg}__")
 
         return node
 
 
-class ScopeVariableGatherer(ast.NodeVisitor):
+# Nodes that define a new scope for the variables inside them.
+# TODO: what about listcomps and genexps? they have scopes
+_SCOPE_NODES = (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+class ScopeVariableGatherer:
     """
     Gather all variables defined in this scope.
 
@@ -339,45 +615,63 @@ class ScopeVariableGatherer(ast.NodeVisitor):
     `global` or `nonlocal` statements.
     """
 
-    def __init__(self) -> None:
-        self.visited_original_scope = False
+    # One gatherer is created per scope, so avoid giving each one a `__dict__`
+    __slots__ = (
+        "local_names",
+        "external_names",
+        "global_or_nonlocal_names",
+        "name_nodes",
+    )
 
+    def __init__(self) -> None:
         self.local_names: set[str] = set()
         self.external_names: set[str] = set()
         self.global_or_nonlocal_names: set[str] = set()
-
-    def generic_visit(self, node: ast.AST) -> None:
-        """Don't visit nodes inside other scopes. Just the current one."""
-        # TODO: try overriding `visit` instead?
-        if not self.visited_original_scope:
-            # Store the args of the given function as local names
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                for arg in (
-                    *node.args.posonlyargs,
-                    *node.args.args,
-                    node.args.vararg,
-                    *node.args.kwonlyargs,
-                    node.args.kwarg,
-                ):
-                    if arg is not None:
-                        self.local_names.add(arg.arg)
-
-            self.visited_original_scope = True
-            # Only visit the body of the original function.
-            super().generic_visit(node)
-
-        # Still visit every child that doesn't have a scope
-        if not isinstance(
-            node,  # TODO: what about listcomps and genexps? they have scopes
-            (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef),
-        ):
-            super().generic_visit(node)
-
-    def visit_Global(self, node: ast.Global) -> None:
-        self.global_or_nonlocal_names.update(node.names)
-
-    def visit_Nonlocal(self, node: ast.Nonlocal) -> None:
-        self.global_or_nonlocal_names.update(node.names)
+        # Every `Name` and `arg` node inside the scope, including nested scopes.
+        self.name_nodes: list[ast.Name | ast.arg] = []
+
+    def visit(self, node: ast.AST) -> None:
+        """Gather the variables of the scope, without looking inside nested scopes."""
+        # Store the args of the given function as local names
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for arg in (
+                *node.args.posonlyargs,
+                *node.args.args,
+                node.args.vararg,
+                *node.args.kwonlyargs,
+                node.args.kwarg,
+            ):
+                if arg is not None:
+                    self.local_names.add(arg.arg)
+
+        # Walk the node depth first using a stack, in the same order as
+        # `ast.NodeVisitor` does, as the order decides which names are stored first.
+        # Nested scopes are walked too, but their names are only collected for
+        # renaming, as they can refer to variables of this scope.
+        stack = [(child, True) for child in ast.iter_child_nodes(node)]
+        stack.reverse()
+        while stack:
+            child, in_scope = stack.pop()
+            if type(child) is ast.Name:
+                self.name_nodes.append(child)
+                if in_scope:
+                    self.visit_Name(child)
+                continue
+
+            if type(child) is ast.arg:
+                self.name_nodes.append(child)
+            elif type(child) is ast.Global or type(child) is ast.Nonlocal:
+                if in_scope:
+                    self.global_or_nonlocal_names.update(child.names)
+                continue
+
+            children_in_scope = in_scope and type(child) not in _SCOPE_NODES
+            grandchildren = [
+                (grandchild, children_in_scope)
+                for grandchild in ast.iter_child_nodes(child)
+            ]
+            grandchildren.reverse()
+            stack.extend(grandchildren)
 
     def visit_Name(self, node: ast.Name) -> None:
         name = node.id
@@ -389,7 +683,7 @@ class ScopeVariableGatherer(ast.NodeVisitor):
             # The name was loaded or deleted before being stored, so it's not local
             return
 
-        if isinstance(node.ctx, ast.Store):
+        if type(node.ctx) is ast.Store:
             # Variable was stored first. It is a local variable.
             self.local_names.add(name)
         else:
@@ -402,44 +696,52 @@ ScopedNode = TypeVar(
 )
 
 
-class LocalVariableRenamer(ast.NodeTransformer):
-    """Rename all variables defined in the current scope."""
+class LocalVariableRenamer(ast.NodeVisitor):
+    """Rename all variables defined in each scope."""
 
-    @staticmethod
-    def dunderify_name_node(node: ast.AST) -> ast.Name:
-        assert isinstance(node, ast.Name)
-        node.id = f"__{node.id}__"
-        return node
+    def visit(self, node: ast.AST) -> None:
+        # Nested scopes come after their parents in `ast.walk`, so reversing it makes
+        # every scope get renamed before the scopes containing it.
+        scopes = [scope for scope in ast.walk(node) if isinstance(scope, _SCOPE_NODES)]
+        scopes.reverse()
 
-    def dunderify_class_or_function(self, node: ScopedNode) -> ScopedNode:
-        gatherer = ScopeVariableGatherer()
-        gatherer.visit(node)
-        local_names = [
-            name
-            for name in gatherer.local_names
-            # If it's already a dunder don't dunderify it
-            if not name.startswith("__") and not name.endswith("__")
-        ]
-        node = VariableRenamer(
-            names=local_names, replacer_function=self.dunderify_name_node
-        ).visit(node)
-        return node
+        gatherers: Iterable[ScopeVariableGatherer]
+        if _GIL_DISABLED and len(scopes) > 1:
+            # Gathering only reads the tree, so free-threaded builds can do every scope
+            # in parallel. Renaming stays in order, as it changes the tree.
+            # Imported here, as only free-threaded builds pay for importing it.
+            import concurrent.futures
 
-    def visit_Module(self, node: ast.Module) -> ast.Module:
-        self.generic_visit(node)
-        return self.dunderify_class_or_function(node)
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                gatherers = list(executor.map(self.gather_variables, scopes))
+        else:
+            gatherers = map(self.gather_variables, scopes)
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> ast.ClassDef:
-        self.generic_visit(node)
-        return self.dunderify_class_or_function(node)
+        for gatherer in gatherers:
+            self.rename_variables(gatherer)
 
-    def visit_FunctionDef(self, fn: ast.FunctionDef) -> ast.FunctionDef:
-        self.generic_visit(fn)
-        return self.dunderify_class_or_function(fn)
+    @staticmethod
+    def gather_variables(scope: ast.AST) -> ScopeVariableGatherer:
+        gatherer = ScopeVariableGatherer()
+        gatherer.visit(scope)
+        return gatherer
 
-    def visit_AsyncFunctionDef(self, fn: ast.AsyncFunctionDef) -> ast.AsyncFunctionDef:
-        self.generic_visit(fn)
-        return self.dunderify_class_or_function(fn)
+    @staticmethod
+    def rename_variables(gatherer: ScopeVariableGatherer) -> None:
+        # Interned, so every renamed node shares a single string per name
+        new_names = {
+            name: sys.intern(f"__{name}__")
+            for name in gatherer.local_names
+            # If it's already a dunder don't dunderify it
+            if not name.startswith("__") and not name.endswith("__")
+        }
+        # Rename the nodes found while gathering, instead of walking the scope again
+        for name_node in gatherer.name_nodes:
+            if isinstance(name_node, ast.Name):
+                if name_node.id in new_names:
+                    name_node.id = new_names[name_node.id]
+            elif name_node.arg in new_names:
+                name_node.arg = new_names[name_node.arg]
 
 
 class BuiltinsRenamer(ast.NodeTransformer):
@@ -450,6 +752,7 @@ class BuiltinsRenamer(ast.NodeTransformer):
     locally defined variables have already been dunderified and no longer clash with
     builtins.
     """
+
     builtin_names = {
         builtin for builtin in dir(builtins) if not builtin.startswith("_")
     }
@@ -470,7 +773,6 @@ class BuiltinsRenamer(ast.NodeTransformer):
         )
 
     def dunderify_builtins(self, node: ScopedNode) -> ScopedNode:
-        
 
         # Any remaining builtin variables are assumed to be actual builtins.
         # This is assumed because the previous visitors should have dunderified all
@@ -6,6 +6,8 @@ import sys
 
 from dunderhell import dunderify
 
+DEFINITION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
 
 def error(message: str) -> None:
     """Print error message."""
@@ -16,24 +18,34 @@ def cli() -> int:
     # TODO: use argparse
     filename = sys.argv[1]
     try:
-        with open(filename) as file:
+        # `ast.parse` decodes the bytes itself, honouring any encoding declaration
+        with open(filename, "rb") as file:
             contents = file.read()
     except OSError as exc:
         error(f"Unable to read {filename}: {exc.strerror}")
         return 2
 
-    try:
-        tree = ast.parse(contents)
-    except ValueError as exc:
+    if b"\0" in contents:
         error(f"Unable to parse {filename} as file contains null bytes")
         return 4
+
+    try:
+        tree = ast.parse(contents)
     except SyntaxError as exc:
         error(f"Unable to parse {filename}:{exc.lineno}:{exc.offset} - {exc.msg}")
         return 3
 
     dunderify(tree)
     # TODO: add --in-place flag to write to file
-    print(ast.unparse(tree))
+    # Unparse one statement at a time, so the whole output is never held in memory
+    for index, statement in enumerate(tree.body):
+        if index > 0 and isinstance(statement, DEFINITION_NODES):
+            # `ast.unparse` puts a blank line before definitions
+            sys.stdout.write("\n")
+
+        sys.stdout.write(ast.unparse(statement))
+        sys.stdout.write("\n")
+
     return 0
 
 
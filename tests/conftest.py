@@ -0,0 +1,31 @@
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--batched",
+        action="store_true",
+        help="Check the test files in batches, instead of one test per file.",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Deselects the dunderhell tests that don't match the `--batched` option."""
+    if config.getoption("batched"):
+        unused_test = "test_dunderhell"
+    else:
+        unused_test = "test_dunderhell_batched"
+
+    selected: list[pytest.Item] = []
+    deselected: list[pytest.Item] = []
+    for item in items:
+        if getattr(item, "originalname", None) == unused_test:
+            deselected.append(item)
+        else:
+            selected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
@@ -1,50 +1,276 @@
 import ast
+import builtins
+import contextlib
+import functools
+import io
 import os.path
-import subprocess
-import sys
+import pickle
+import re
+import types
+from typing import Optional, Union
 
 import pytest
 
-import dunderhell
+CaseFiles = tuple[str, str]
 
+BATCH_SIZE = 20
 
-def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
-    """Generates all dunderhell tests based on files in the test_files folder."""
+# Seconds that a test script running in a separate interpreter gets to finish
+SUBPROCESS_TIMEOUT = 30
+
+# Groups numbered variants of a test file together, eg. `foo.py` and `foo_2.py`
+TEST_GROUP_PATTERN = re.compile(r"^([a-z_]+?)(?:_\d+)?\.py$")
+
+
+def collect_test_cases() -> tuple[list[CaseFiles], list[str]]:
+    """
+    Finds all dunderhell test cases in the test_files folder.
+    Returns the test cases along with their ids.
+    """
     test_files_path = os.path.join(os.path.dirname(__file__), "test_files")
 
-    test_params: list[tuple[str, str]] = []
-    for file_name in os.listdir(test_files_path):
+    with os.scandir(test_files_path) as dir_entries:
+        entries = {entry.name: entry for entry in dir_entries if entry.is_file()}
+
+    test_cases: list[CaseFiles] = []
+    test_ids: list[str] = []
+    for file_name, entry in entries.items():
         if not file_name.endswith(".py"):
             continue
         if file_name.endswith(".result.py"):
             continue
 
-        file_path = os.path.join(test_files_path, file_name)
-        autofixed_file_path = file_path.removesuffix(".py") + ".result.py"
-        if not os.path.exists(autofixed_file_path):
+        autofixed_file_name = file_name[:-3] + ".result.py"
+        autofixed_entry = entries.get(autofixed_file_name)
+        if autofixed_entry is None:
+            autofixed_file_path = os.path.join(test_files_path, autofixed_file_name)
             raise AssertionError(f"Expected {autofixed_file_path} to exist")
 
-        test_params.append((file_path, autofixed_file_path))
+        test_cases.append((entry.path, autofixed_entry.path))
+        test_ids.append(file_name)
 
-    metafunc.parametrize(("file_path", "dunderified_file_path"), test_params)
+    return test_cases, test_ids
 
 
-def test_dunderhell(file_path: str, dunderified_file_path: str) -> None:
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """
+    Generates all dunderhell tests based on files in the test_files folder.
+
+    By default there's one test per file. With `--batched`, the files are instead
+    checked `BATCH_SIZE` at a time, to pay pytest's per-test overhead once per batch.
+    Both kinds of tests are generated, and `conftest.py` deselects the unused one.
+
+    Variants of the same test file are put in one `xdist_group`, so that with
+    `pytest -n auto --dist=loadgroup` they all run on the same worker.
+    """
+    test_cases, test_ids = collect_test_cases()
+
+    if "file_path" in metafunc.fixturenames:
+        test_params = []
+        for test_case, test_id in zip(test_cases, test_ids):
+            match = TEST_GROUP_PATTERN.match(test_id)
+            group = match.group(1) if match else test_id
+            test_params.append(
+                pytest.param(
+                    *test_case, id=test_id, marks=pytest.mark.xdist_group(name=group)
+                )
+            )
+
+        metafunc.parametrize(("file_path", "dunderified_file_path"), test_params)
+
+    if "test_case_batch" in metafunc.fixturenames:
+        batches = [
+            test_cases[index : index + BATCH_SIZE]
+            for index in range(0, len(test_cases), BATCH_SIZE)
+        ]
+
+        metafunc.parametrize(
+            "test_case_batch",
+            batches,
+            ids=[f"batch{index}" for index in range(len(batches))],
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def load_test_files(
+    file_path: str, dunderified_file_path: str
+) -> tuple[bytes, ast.Module, bytes, bytes]:
+    """
+    Reads and parses the test files once per session, even if the tests get rerun.
+    Returns the contents, the AST of the contents along with its pickled copy, and
+    the expected output.
+    """
+    # Kept as bytes, as that's all that parsing, comparing and compiling them needs
+    with open(file_path, "rb") as file:
+        contents = file.read().rstrip(b"\n")
+    with open(dunderified_file_path, "rb") as dunderified_file:
+        dunderified_contents = dunderified_file.read().rstrip(b"\n")
+
+    tree = ast.parse(contents)
+    return contents, tree, pickle.dumps(tree), dunderified_contents
+
+
+@functools.lru_cache(maxsize=None)
+def compile_source(source: Union[bytes, ast.Module], filename: str) -> types.CodeType:
+    """
+    Compiles the given source or AST once per session, even if the tests get rerun.
+    Compiling an AST skips parsing the source again.
+    """
+    return compile(source, filename, "exec")
+
+
+def run_python(
+    source: bytes,
+    filename: str,
+    in_process: bool = True,
+    tree: Optional[ast.Module] = None,
+) -> str:
+    """
+    Runs the given Python source and returns what it printed. If the source has
+    already been parsed, its tree gets compiled instead.
+
+    Runs inside the test process by default, as starting a new interpreter for every
+    script is by far the slowest part of the tests.
+    """
+    if not in_process:
+        import subprocess
+        import sys
+
+        return subprocess.run(
+            [sys.executable, "-c", source.decode()],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            check=True,
+            text=True,
+            timeout=SUBPROCESS_TIMEOUT,
+        ).stdout
+
+    # `__name__` must be "__main__", as dunderified code relies on its length.
+    namespace = {"__name__": "__main__", "__builtins__": builtins}
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        code = compile_source(source if tree is None else tree, filename)
+        exec(code, namespace)
+
+    return output.getvalue()
+
+
+def check_dunderhell(file_path: str, dunderified_file_path: str) -> None:
     """
     Ensure that `foo.py` dunderified becomes `foo.result.py`, and the output of
     running both files is identical.
     """
+    # Imported here so that collecting the tests doesn't have to import dunderhell
+    import dunderhell
+
+    contents, original_tree, pickled_tree, dunderified_contents = load_test_files(
+        file_path, dunderified_file_path
+    )
+    # Unpickling gives a fresh copy of the tree, as `dunderify` modifies it
+    tree = pickle.loads(pickled_tree)
+    dunderhell.dunderify(tree)
+    output_contents = ast.unparse(tree).encode()
+    assert output_contents == dunderified_contents
+
+    # Run both the original and dunderified scripts and ensure same output.
+    # Test files that need a fresh interpreter can opt out of running in-process.
+    in_process = b"SUBPROCESS_REQUIRED = True" not in contents
+    expected_output = run_python(contents, file_path, in_process, tree=original_tree)
+    dunderified_output = run_python(
+        dunderified_contents, dunderified_file_path, in_process
+    )
+    assert expected_output == dunderified_output
+
+
+def test_dunderhell(file_path: str, dunderified_file_path: str) -> None:
+    check_dunderhell(file_path, dunderified_file_path)
+
+
+def test_dunderhell_batched(test_case_batch: list[CaseFiles]) -> None:
+    """Runs `check_dunderhell` on a batch of test files, enabled by `--batched`."""
+    for file_path, dunderified_file_path in test_case_batch:
+        try:
+            check_dunderhell(file_path, dunderified_file_path)
+        except Exception as exc:
+            pytest.fail(f"{file_path}: {type(exc).__name__}: {exc}")
+
+
+def test_dunderhell_ignores_trailing_comments() -> None:
+    """
+    Comments don't make it into the AST, so a trailing comment must not change the
+    output. Checked on the in-memory source, instead of keeping near-identical copies
+    of a test file that only differ by their comments.
+    """
+    import dunderhell
+
+    test_files_path = os.path.join(os.path.dirname(__file__), "test_files")
+    file_path = os.path.join(test_files_path, "local_variables.py")
+    dunderified_file_path = os.path.join(test_files_path, "local_variables.result.py")
     with open(file_path) as file, open(dunderified_file_path) as dunderified_file:
         contents = file.read().rstrip("\n")
         dunderified_contents = dunderified_file.read().rstrip("\n")
 
-    tree = ast.parse(contents)
+    source = contents + "\n# TODO: handle nonlocal variables\n"
+    assert dunderhell.dunderify_source(source) == dunderified_contents
+
+
+def test_dunderify_keeps_number_trees_intact() -> None:
+    """`dunderify` must not convert the number trees that `NumberVisitor` shares."""
+    import dunderhell
+
+    dunderhell.dunderify_source("print(2)")
+    tree = dunderhell.NumberVisitor().visit(ast.parse("2"))
+    assert ast.unparse(tree) == (
+        "__name__.__len__() // __name__.__len__()"
+        " + __name__.__len__() // __name__.__len__()"
+    )
+
+
+def test_number_visitor_trees_share_no_nodes() -> None:
+    """Running `OpVisitor` after `NumberVisitor` must not change later number trees."""
+    import dunderhell
+
+    outputs = []
+    for _ in range(2):
+        tree = ast.parse("print(97)")
+        dunderhell.NumberVisitor().visit(tree)
+        dunderhell.OpVisitor().visit(tree)
+        outputs.append(ast.unparse(tree))
+
+    assert outputs[0] == outputs[1]
+    tree = dunderhell.NumberVisitor().visit(ast.parse("x = 97"))
+    assert "__add__" not in ast.unparse(tree)
+
+
+def test_string_visitor_trees_share_no_nodes() -> None:
+    """Running `NumberVisitor` after `StringVisitor` must not change later strings."""
+    import dunderhell
+
+    tree = dunderhell.StringVisitor().visit(ast.parse("print('a')"))
+    dunderhell.NumberVisitor().visit(tree)
+
+    tree = dunderhell.StringVisitor().visit(ast.parse("x = 'a'"))
+    assert ast.unparse(tree.body[-1]) == "x = __chr__(97)"
+
+
+def test_dunderify_trees_share_no_nodes() -> None:
+    """Changing one dunderified tree must not change what later calls return."""
+    import dunderhell
+
+    tree = ast.parse("print('a', 1)")
     dunderhell.dunderify(tree)
-    output_contents = ast.unparse(tree)
-    assert output_contents == dunderified_contents
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            node.id = "__oops__"
 
-    # Run both the original and dunderified scripts and ensure same output
-    python = sys.executable
-    expected_output = subprocess.check_output([python, "-c", contents])
-    dunderified_output = subprocess.check_output([python, "-c", dunderified_contents])
-    assert expected_output == dunderified_output
+    assert "__oops__" not in dunderhell.dunderify_source("print('a', 1)")
+
+
+def test_dunderhell_free_threaded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Checks every test file with the scopes gathered in parallel, as on nogil."""
+    import dunderhell
+
+    monkeypatch.setattr(dunderhell, "_GIL_DISABLED", True)
+    test_cases, _ = collect_test_cases()
+    for file_path, dunderified_file_path in test_cases:
+        check_dunderhell(file_path, dunderified_file_path)
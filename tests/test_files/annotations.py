@@ -0,0 +1,8 @@
+T = int
+
+
+def f(x: T) -> T:
+    return x + 1
+
+
+print(f(2))
@@ -0,0 +1,2 @@
+x = 5
+print(2 * 3 - 4 // 2, x + 1, 10 - 3 * x, 7 - 10)
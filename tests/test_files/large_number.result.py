@@ -1,2 +1,2 @@
-__chr__ = __builtins__.__getattribute__(__name__.__reduce__.__name__[__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()))].__add__(__name__.__add__.__class__.__name__[__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()))]).__add__(__name__.__class__.__name__[__name__.__len__().__floordiv__(__name__.__len__()).__neg__()]))
-__builtins__.__getattribute__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__())).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))))(__name__.__len__().__mul__(__name__.__len__()).__mul__(__name__.__len__()).__mul__(__name__.__len__()).__mul__(__name__.__len__()).__add__(__name__.__len__().__mul__(__name__.__len__()).__mul__(__name__.__len__()).__mul__(__name__.__len__()).__mul__(__name__.__len__())).__add__(__name__.__len__().__mul__(__name__.__len__()).__mul__(__name__.__len__()).__mul__(__name__.__len__()).__mul__(__name__.__len__())).__add__(__name__.__len__().__mul__(__name__.__len__()).__mul__(__name__.__len__())).__add__(__name__.__len__().__mul__(__name__.__len__()).__mul__(__name__.__len__())).__add__(__name__.__len__().__mul__(__name__.__len__()).__mul__(__name__.__len__())).__add__(__name__.__len__().__mul__(__name__.__len__())).__add__(__name__.__len__().__mul__(__name__.__len__())).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()))
+__chr__ = __builtins__.__getattribute__(__name__.__reduce__.__name__[__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))].__add__(__name__.__add__.__class__.__name__[__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())))]).__add__(__name__.__class__.__name__[__name__.__len__().__floordiv__(__name__.__len__()).__neg__()]))
+__builtins__.__getattribute__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())))))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())))))))))))(__name__.__len__().__mul__(__name__.__len__()).__mul__(__name__.__len__().__mul__(__name__.__len__().__mul__(__name__.__len__()))).__add__(__name__.__len__().__mul__(__name__.__len__()).__mul__(__name__.__len__().__mul__(__name__.__len__().__mul__(__name__.__len__()))).__add__(__name__.__len__().__mul__(__name__.__len__()).__mul__(__name__.__len__().__mul__(__name__.__len__().__mul__(__name__.__len__()))))).__add__(__name__.__len__().__mul__(__name__.__len__().__mul__(__name__.__len__())).__add__(__name__.__len__().__mul__(__name__.__len__().__mul__(__name__.__len__())).__add__(__name__.__len__().__mul__(__name__.__len__().__mul__(__name__.__len__()))))).__add__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__().__add__(__name__.__len__())))))
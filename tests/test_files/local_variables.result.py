@@ -1,4 +1,4 @@
-__chr__ = __builtins__.__getattribute__(__name__.__reduce__.__name__[__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()))].__add__(__name__.__add__.__class__.__name__[__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()))]).__add__(__name__.__class__.__name__[__name__.__len__().__floordiv__(__name__.__len__()).__neg__()]))
+__chr__ = __builtins__.__getattribute__(__name__.__reduce__.__name__[__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))].__add__(__name__.__add__.__class__.__name__[__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())))]).__add__(__name__.__class__.__name__[__name__.__len__().__floordiv__(__name__.__len__()).__neg__()]))
 import ast
 
 class SomeVisitor(ast.NodeVisitor):
@@ -9,4 +9,4 @@ def dunderify(__tree__: ast.AST) -> None:
     for __visitor__ in __visitors__:
         __visitor__.visit(__tree__)
     ast.fix_missing_locations(__tree__)
-__builtins__.__getattribute__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__())).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))))(__builtins__.__getattribute__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))))(ast.unparse(ast.parse(__chr__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))).__add__(__chr__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()))).__add__(__chr__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))).__add__(__chr__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()))).__add__(__chr__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())))))))))
+__builtins__.__getattribute__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())))))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())))))))))))(__builtins__.__getattribute__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())))))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()))))).__add__(__chr__(__name__.__len__().__mul__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))))))))(ast.unparse(ast.parse(__chr__(__name__.__len__().__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()))))).__add__(__chr__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__())))).__add__(__chr__(__name__.__len__().__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__()))))))).__add__(__chr__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__()))).__add__(__chr__(__name__.__len__().__add__(__name__.__len__().__add__(__name__.__len__())).__add__(__name__.__len__().__add__(__name__.__len__()).__add__(__name__.__len__().__add__(__name__.__len__().__floordiv__(__name__.__len__()).__add__(__name__.__len__().__floordiv__(__name__.__len__())))))))))))))